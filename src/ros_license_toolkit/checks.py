@@ -17,6 +17,7 @@
 """This module contains the checks for the linter."""
 
 from enum import IntEnum
+from typing import Callable, Optional
 
 from ros_license_toolkit.package import Package, PackageException
 from ros_license_toolkit.ui_elements import NO_REASON_STR, green, red, yellow
@@ -44,6 +45,9 @@ class Check:
         # string with additional information for verbose output
         self.verbose_output: str = ""
 
+        # function to build `verbose_output` only when it is needed
+        self._verbose_output_factory: Optional[Callable[[], str]] = None
+
     def _failed(self, reason: str):
         """Set this check as failed for `reason`."""
         self.status = Status.FAILURE
@@ -65,17 +69,25 @@ class Check:
 
     def __str__(self) -> str:
         """Return formatted string for normal output."""
-        info: str = str(type(self).__name__) + "\n"
         if self.status == Status.SUCCESS:
-            info += green(f" SUCCESS {self.reason}")
+            result = green(f" SUCCESS {self.reason}")
         elif self.status == Status.WARNING:
-            info += yellow(f" WARNING {self.reason}")
+            result = yellow(f" WARNING {self.reason}")
         else:
-            info += red(f" FAILURE {self.reason}")
-        return info
+            result = red(f" FAILURE {self.reason}")
+        return f"{type(self).__name__}\n{result}"
+
+    def _set_verbose_output_factory(self, factory: Callable[[], str]):
+        """Set a function that builds the verbose output. It is only called
+        if the verbose output is actually requested, because formatting
+        scan results can be expensive for large packages."""
+        self._verbose_output_factory = factory
 
     def verbose(self) -> str:
         """Return string with additional information for verbose output."""
+        if self._verbose_output_factory is not None:
+            self.verbose_output = self._verbose_output_factory()
+            self._verbose_output_factory = None
         return self.verbose_output
 
     def __bool__(self) -> bool:
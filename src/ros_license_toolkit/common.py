@@ -17,10 +17,17 @@
 """Common utility functions."""
 
 import os
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
 
 REQUIRED_PERCENTAGE_OF_LICENSE_TEXT = 90.0
 
+# below this number of files, starting a process pool is not worth it
+MIN_FILES_FOR_PARALLEL_SCAN = 8
+
+# number of files handed to a worker process at once
+SCAN_CHUNKSIZE = 16
+
 # files we ignore in scan results
 IGNORED = [
     "CHANGELOG.rst",
@@ -30,6 +37,19 @@ IGNORED = [
     "setup.cfg",
     "CMakeLists.txt",
     ".git/*",
+    # binary files, like build artifacts, images, meshes and bags
+    "*.pyc",
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.stl",
+    "*.STL",
+    "*.bag",
+    "*.db3",
+    "*.so",
+    "*.o",
+    "*.a",
 ]
 
 
@@ -40,20 +60,45 @@ def get_spdx_license_name(scan_results: Dict[str, Any]) -> Optional[str]:
     return None
 
 
+def get_available_cpus() -> int:
+    """Get the number of CPUs this process may run on. Unlike
+    `os.cpu_count`, this respects the CPU affinity, e.g. in containers."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def scan_files(
+    scan_function: Callable[[str], Dict[str, Any]],
+    fpaths: List[str],
+    warm_up: Optional[Callable[[], Any]] = None,
+    jobs: int = 1,
+) -> Dict[str, Dict[str, Any]]:
+    """Run `scan_function` (e.g. scancode's `get_licenses`) on all `fpaths`
+    and return the results by path. This is done in `jobs` parallel
+    processes if there are enough files to make up for the overhead.
+    `warm_up` is called before the worker processes are started, e.g. to
+    load scancode's license index only once. Forked workers then share it,
+    instead of each loading its own copy."""
+    if jobs <= 1 or len(fpaths) < MIN_FILES_FOR_PARALLEL_SCAN:
+        return {fpath: scan_function(fpath) for fpath in fpaths}
+    if warm_up is not None:
+        warm_up()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return dict(zip(fpaths, pool.map(scan_function, fpaths, chunksize=SCAN_CHUNKSIZE)))
+
+
 def get_ignored_content(pkg_abspath: str) -> List[str]:
     """Return all ignored patterns from '.scanignore'
     and local IGNORED definition."""
     ignored_content: List[str] = []
-    scanignore_path = pkg_abspath + "/.scanignore"
-    if os.path.exists(scanignore_path):
-        with open(scanignore_path, "r", encoding="utf-8") as f:
+    try:
+        with open(os.path.join(pkg_abspath, ".scanignore"), "r", encoding="utf-8") as f:
             for line in f:
-                line_contents = line.split("#")
-                ignore_pattern = line_contents[0].rstrip()
+                ignore_pattern = line.partition("#")[0].rstrip()
                 if len(ignore_pattern) > 0:
                     ignored_content.append(ignore_pattern)
-            f.close()
-    for pattern in IGNORED:
-        if pattern not in ignored_content:
-            ignored_content.append(pattern)
-    return ignored_content
+    except FileNotFoundError:
+        pass
+    # without duplicates, but in order
+    return list(dict.fromkeys(ignored_content + IGNORED))
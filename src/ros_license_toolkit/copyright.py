@@ -17,10 +17,16 @@
 """Assemble copyright notices for a package."""
 
 import os
+import re
 from typing import Any, Dict, List
 
 from scancode.api import get_copyrights
 
+from ros_license_toolkit.scan_cache import scan_files_cached
+
+# prefix removed from copyright notices, e.g. "Copyright (c) "
+COPYRIGHT_PREFIX_RE = re.compile(r"copyright(?: \(c\))? ?", re.IGNORECASE)
+
 
 def _get_copyright_strs_from_results(scan_results: Dict[str, Any]) -> List[str]:
     """Get copyright strings from scan results."""
@@ -28,29 +34,38 @@ def _get_copyright_strs_from_results(scan_results: Dict[str, Any]) -> List[str]:
 
 
 def _clean_copyright_text(copyright_text: str):
-    for prefix_to_remove in [
-        "copyright (c) ",
-        "copyright (c)",
-        "copyright ",
-        "copyright",
-    ]:
-        if copyright_text.lower().startswith(prefix_to_remove):
-            copyright_text = copyright_text[len(prefix_to_remove) :]
-            break
-    return copyright_text
+    prefix = COPYRIGHT_PREFIX_RE.match(copyright_text)
+    if prefix is None:
+        return copyright_text
+    return copyright_text[prefix.end() :]
 
 
 def get_copyright_strings_per_pkg(pkg) -> Dict[str, List[str]]:
     """Get a dictionary of license keys and their respective notices."""
     copyright_strings: Dict[str, List[str]] = {}
+    source_files = sorted(
+        set().union(*(license_tag.source_files for license_tag in pkg.license_tags.values()))
+    )
+    pkg_prefix = os.path.join(pkg.abspath, "")
+    # results by source file, relative to the package
+    scan_results = dict(
+        zip(
+            source_files,
+            scan_files_cached(
+                "copyrights",
+                get_copyrights,
+                [pkg_prefix + f for f in source_files],
+                jobs=pkg.scan_jobs,
+            ).values(),
+        )
+    )
     for key, license_tag in pkg.license_tags.items():
-        cprs = set()
-        for source_file in license_tag.source_files:
-            fpath = os.path.join(pkg.abspath, source_file)
-            res = get_copyrights(fpath)
-            if len(res) == 0:
-                continue
-            for cpr in _get_copyright_strs_from_results(res):
-                cprs.add(_clean_copyright_text(cpr))
-        copyright_strings[key] = sorted(list(cprs))
+        copyright_strings[key] = sorted(
+            {
+                _clean_copyright_text(cpr)
+                for source_file in license_tag.source_files
+                if scan_results[source_file]
+                for cpr in _get_copyright_strs_from_results(scan_results[source_file])
+            }
+        )
     return copyright_strings
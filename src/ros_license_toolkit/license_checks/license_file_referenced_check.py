@@ -32,22 +32,24 @@ class LicenseFilesReferencedCheck(Check):
         self.inofficial_covered_texts: Dict[str, List[str]] = {}
 
     def _check(self, package: Package):
+        pkg_path = os.path.abspath(package.abspath)
         for filename, license_text in package.found_license_texts.items():
             # skipping all declarations above the package
-            if not is_in_package(package, filename):
+            if not _is_in_path(pkg_path, filename):
                 continue
             self._handle_inofficial_licenses(package, filename, license_text)
         self._evaluate_results()
 
     def _handle_inofficial_licenses(self, package: Package, filename, license_text):
+        license_tags = package.license_tags
         if (
             "detected_license_expression_spdx" in license_text
-            and license_text["detected_license_expression_spdx"] not in package.license_tags
+            and license_text["detected_license_expression_spdx"] not in license_tags
         ):
             spdx_expression = license_text["detected_license_expression_spdx"]
             inofficial_licenses = {
                 lic_tag.id_from_license_text: key
-                for key, lic_tag in package.license_tags.items()
+                for key, lic_tag in license_tags.items()
                 if lic_tag.id_from_license_text != ""
             }
             if spdx_expression in inofficial_licenses:
@@ -87,9 +89,11 @@ class LicenseFilesReferencedCheck(Check):
 def is_in_package(package: Package, file: str) -> bool:
     """Return TRUE if the file is underneath the absolute package path.
     Return FALSE if file is located above package."""
-    parent = os.path.abspath(package.abspath)
-    child = os.path.abspath(package.abspath + "/" + file)
+    return _is_in_path(os.path.abspath(package.abspath), file)
 
-    comm_parent = os.path.commonpath([parent])
-    comm_child_parent = os.path.commonpath([parent, child])
-    return comm_parent == comm_child_parent
+
+def _is_in_path(parent: str, file: str) -> bool:
+    """Return TRUE if `file` (relative to `parent`) is underneath `parent`,
+    which must be absolute."""
+    child = os.path.abspath(os.path.join(parent, file))
+    return child == parent or child.startswith(os.path.join(parent, ""))
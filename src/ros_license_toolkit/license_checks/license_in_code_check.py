@@ -44,8 +44,17 @@ class LicensesInCodeCheck(Check):
         self._evaluate_result(package)
 
     def _check_license_files(self, package: Package) -> None:
+        license_tags = package.license_tags
+        declared_licenses = self.declared_licenses
+        license_files = set(package.get_license_files())
+        # licenses detected in the license texts of tags with unofficial ids
+        unofficial_licenses = {
+            lic_tag.id_from_license_text: key
+            for key, lic_tag in license_tags.items()
+            if lic_tag.id_from_license_text != ""
+        }
         for fname, found_licenses in package.found_files_w_licenses.items():
-            if fname in package.get_license_files():
+            if fname in license_files:
                 # the actual license text files are not relevant for this
                 continue
             found_licenses_str = found_licenses["detected_license_expression_spdx"]
@@ -53,32 +62,23 @@ class LicensesInCodeCheck(Check):
                 continue
             licenses = found_licenses_str.split(" AND ")
             for license_str in licenses:
-                if license_str not in self.declared_licenses:
+                if license_str not in declared_licenses:
                     # this license has an unofficial tag
-                    unofficial_licenses = {
-                        lic_tag.id_from_license_text: key
-                        for key, lic_tag in package.license_tags.items()
-                        if lic_tag.id_from_license_text != ""
-                    }
-                    if license_str in unofficial_licenses.keys():
-                        if fname not in self.files_with_unofficial_tag:
-                            self.files_with_unofficial_tag[fname] = []
-                        self.files_with_unofficial_tag[fname].append(license_str)
-                        self.files_with_unofficial_tag[fname].append(
-                            unofficial_licenses[license_str]
+                    unofficial_tag = unofficial_licenses.get(license_str)
+                    if unofficial_tag is not None:
+                        self.files_with_unofficial_tag.setdefault(fname, []).extend(
+                            (license_str, unofficial_tag)
                         )
                         continue
                     # this license is not declared by any license tag
-                    if fname not in self.files_with_uncovered_licenses:
-                        self.files_with_uncovered_licenses[fname] = []
-                    self.files_with_uncovered_licenses[fname].append(license_str)
+                    self.files_with_uncovered_licenses.setdefault(fname, []).append(license_str)
                     continue
-                if fname not in self.declared_licenses[license_str].source_files:
+                if fname not in declared_licenses[license_str].source_files:
                     # this license is declared by a license tag but the file
                     # is not listed in the source files of the license tag
-                    if fname not in self.files_not_matched_by_any_license_tag:
-                        self.files_not_matched_by_any_license_tag[fname] = []
-                    self.files_not_matched_by_any_license_tag[fname].append(license_str)
+                    self.files_not_matched_by_any_license_tag.setdefault(fname, []).append(
+                        license_str
+                    )
                     continue
 
     def _evaluate_result(self, package: Package) -> None:
@@ -141,14 +141,16 @@ class LicensesInCodeCheck(Check):
     ):
         assert info_str != ""
         self._failed(info_str)
-        self.verbose_output = red(
-            "\n  Relevant scan results:\n"
-            + pformat(
-                list(
-                    filter(
-                        lambda x: x[0] in files_with_uncovered_licenses
-                        or (x[0] in files_not_matched_by_any_license_tag),
-                        package.found_files_w_licenses.items(),
+        self._set_verbose_output_factory(
+            lambda: red(
+                "\n  Relevant scan results:\n"
+                + pformat(
+                    list(
+                        filter(
+                            lambda x: x[0] in files_with_uncovered_licenses
+                            or (x[0] in files_not_matched_by_any_license_tag),
+                            package.found_files_w_licenses.items(),
+                        )
                     )
                 )
             )
@@ -25,8 +25,9 @@ class LicenseTagExistsCheck(Check):
     """This ensures that a tag defining the license exists."""
 
     def _check(self, package: Package):
-        if len(package.license_tags) == 0:
+        license_tags = package.license_tags
+        if len(license_tags) == 0:
             self._failed("No license tag defined.")
-            self.verbose_output = red(str(package.package_xml))
+            self._set_verbose_output_factory(lambda: red(str(package.package_xml)))
         else:
-            self._success(f"Found licenses {list(map(str, package.license_tags))}")
+            self._success(f"Found licenses {list(map(str, license_tags))}")
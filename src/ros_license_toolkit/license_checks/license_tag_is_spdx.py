@@ -25,10 +25,11 @@ class LicenseTagIsInSpdxListCheck(Check):
     """This ensures that the license tag is in the SPDX list of licenses."""
 
     def _check(self, package: Package):
-        licenses_not_in_spdx_list = []
-        for license_tag in package.license_tags.keys():
-            if not is_license_name_in_spdx_list(license_tag):
-                licenses_not_in_spdx_list.append(license_tag)
+        licenses_not_in_spdx_list = [
+            license_tag
+            for license_tag in package.license_tags
+            if not is_license_name_in_spdx_list(license_tag)
+        ]
         if len(licenses_not_in_spdx_list) > 0:
             self._warning(
                 f"Licenses {licenses_not_in_spdx_list} are "
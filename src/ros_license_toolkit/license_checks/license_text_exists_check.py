@@ -17,7 +17,7 @@
 """This Module contains LicenseTextExistsCheck, which implements Check."""
 
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, NamedTuple, Optional, Set
 
 from ros_license_toolkit.checks import Check, Status
 from ros_license_toolkit.common import get_spdx_license_name
@@ -26,13 +26,19 @@ from ros_license_toolkit.package import Package
 from ros_license_toolkit.ui_elements import red
 
 
+class MissingLicenseText(NamedTuple):
+    """Why a license tag has no valid license text and how severe that is."""
+
+    reason: str
+    status: Status
+
+
 class LicenseTextExistsCheck(Check):
     """This ensures that the license text file referenced by the tag exists."""
 
     def __init__(self: "LicenseTextExistsCheck"):
         Check.__init__(self)
-        self.license_tags_without_license_text: Dict[LicenseTag, str] = {}
-        self.missing_license_texts_status: Dict[LicenseTag, Status] = {}
+        self.license_tags_without_license_text: Dict[LicenseTag, MissingLicenseText] = {}
         self.files_with_wrong_tags: Dict[LicenseTag, Dict[str, str]] = {}
         self.found_license_texts: Dict[str, Any] = {}
 
@@ -48,88 +54,99 @@ class LicenseTextExistsCheck(Check):
         """checks each license tag for the corresponding license text. Also
         detects unofficial licenses when tag is not in the SPDX license list"""
         self.found_license_texts = package.found_license_texts
+        existing_license_text_files = _get_existing_files(
+            package.abspath,
+            {
+                license_tag.get_license_text_file()
+                for license_tag in package.license_tags.values()
+                if license_tag.has_license_text_file()
+            },
+        )
         for license_tag in package.license_tags.values():
-            if not license_tag.has_license_text_file():
-                self.license_tags_without_license_text[license_tag] = (
-                    "No license text file defined."
-                )
-                self.missing_license_texts_status[license_tag] = Status.FAILURE
-                continue
-            license_text_file = license_tag.get_license_text_file()
-            if not os.path.exists(os.path.join(package.abspath, license_text_file)):
-                self.license_tags_without_license_text[license_tag] = (
-                    f"License text file '{license_text_file}' does not exist."
-                )
-                self.missing_license_texts_status[license_tag] = Status.FAILURE
-                continue
-            if license_text_file not in self.found_license_texts:
-                self.license_tags_without_license_text[license_tag] = (
-                    f"License text file '{license_text_file}' not included" + " in scan results."
-                )
-                self.missing_license_texts_status[license_tag] = Status.FAILURE
-                continue
-            if not get_spdx_license_name(self.found_license_texts[license_text_file]):
-                self.license_tags_without_license_text[license_tag] = (
-                    f"License text file '{license_text_file}' is not "
-                    + "recognized as license text."
-                )
-                self.missing_license_texts_status[license_tag] = Status.FAILURE
-                continue
-            actual_license: Optional[str] = get_spdx_license_name(
-                self.found_license_texts[license_text_file]
+            missing = self._get_missing_license_text(license_tag, existing_license_text_files)
+            if missing is not None:
+                self.license_tags_without_license_text[license_tag] = missing
+
+    def _get_missing_license_text(
+        self, license_tag: LicenseTag, existing_license_text_files: Set[str]
+    ) -> Optional[MissingLicenseText]:
+        """Check the license text of one license tag. Return why it is not
+        valid, or None if it is."""
+        if not license_tag.has_license_text_file():
+            return MissingLicenseText("No license text file defined.", Status.FAILURE)
+        license_text_file = license_tag.get_license_text_file()
+        if license_text_file not in existing_license_text_files:
+            return MissingLicenseText(
+                f"License text file '{license_text_file}' does not exist.", Status.FAILURE
             )
-            if actual_license is None:
-                self.license_tags_without_license_text[license_tag] = (
-                    f"License text file '{license_text_file}'"
-                    + " is not recognized as license text."
-                )
-                self.missing_license_texts_status[license_tag] = Status.FAILURE
-                continue
-            if actual_license != license_tag.get_license_id():
-                self.license_tags_without_license_text[license_tag] = (
-                    f"License text file '{license_text_file}' is "
-                    + f"of license {actual_license} but tag is "
-                    + f"{license_tag.get_license_id()}."
-                )
+        if license_text_file not in self.found_license_texts:
+            return MissingLicenseText(
+                f"License text file '{license_text_file}' not included in scan results.",
+                Status.FAILURE,
+            )
+        actual_license: Optional[str] = get_spdx_license_name(
+            self.found_license_texts[license_text_file]
+        )
+        if not actual_license:
+            return MissingLicenseText(
+                f"License text file '{license_text_file}' is not recognized as license text.",
+                Status.FAILURE,
+            )
+        license_id = license_tag.get_license_id()
+        if actual_license != license_id:
+            self.files_with_wrong_tags[license_tag] = {
+                "actual_license": actual_license,
+                "license_tag": license_id,
+            }
+            return MissingLicenseText(
+                f"License text file '{license_text_file}' is "
+                + f"of license {actual_license} but tag is "
+                + f"{license_id}.",
                 # If Tag and File both are in SPDX but don't match -> Error
-                if is_license_name_in_spdx_list(license_tag.get_license_id()):
-                    self.missing_license_texts_status[license_tag] = Status.FAILURE
-                else:
-                    self.missing_license_texts_status[license_tag] = Status.WARNING
-                self.files_with_wrong_tags[license_tag] = {
-                    "actual_license": actual_license,
-                    "license_tag": license_tag.get_license_id(),
-                }
-                continue
+                (Status.FAILURE if is_license_name_in_spdx_list(license_id) else Status.WARNING),
+            )
+        return None
 
     def _evaluate_results(self):
         if len(self.license_tags_without_license_text) > 0:
-            if max(self.missing_license_texts_status.values()) == Status.WARNING:
+            license_tags_str = "\n".join(
+                [
+                    f"  '{tag}': {missing.reason}"
+                    for tag, missing in self.license_tags_without_license_text.items()
+                ]
+            )
+            if any(
+                missing.status == Status.FAILURE
+                for missing in self.license_tags_without_license_text.values()
+            ):
+                self._failed(
+                    "The following license tags do not "
+                    "have a valid license text "
+                    "file:\n" + license_tags_str
+                )
+            else:
                 self._warning(
                     "Since they are not in the SPDX list, "
                     "we can not check if these tags have the correct "
-                    "license text:\n"
-                    + "\n".join(
-                        [
-                            f"  '{x[0]}': {x[1]}"
-                            for x in self.license_tags_without_license_text.items()
-                        ]
-                    )
+                    "license text:\n" + license_tags_str
                 )
-            else:
-                self._failed(
-                    "The following license tags do not "
-                    "have a valid license text "
-                    "file:\n"
-                    + "\n".join(
-                        [
-                            f"  '{x[0]}': {x[1]}"
-                            for x in self.license_tags_without_license_text.items()
-                        ]
-                    )
+            self._set_verbose_output_factory(
+                lambda: red(
+                    "\n".join([f"  '{x[0]}': {x[1]}" for x in self.found_license_texts.items()])
                 )
-            self.verbose_output = red(
-                "\n".join([f"  '{x[0]}': {x[1]}" for x in self.found_license_texts.items()])
             )
         else:
             self._success("All license tags have a valid license text file.")
+
+
+def _get_existing_files(base_path: str, fnames: Set[str]) -> Set[str]:
+    """Return those of `fnames` (relative to `base_path`) that exist."""
+    existing = set()
+    base_prefix = os.path.join(base_path, "")
+    for fname in fnames:
+        try:
+            os.stat(base_prefix + fname)
+        except OSError:
+            continue
+        existing.add(fname)
+    return existing
@@ -17,6 +17,7 @@
 """This Module contains SchemaCheck, which implements Check."""
 
 import os
+from functools import lru_cache
 from typing import Optional, Tuple
 
 from lxml import etree
@@ -24,6 +25,9 @@ from lxml import etree
 from ros_license_toolkit.checks import Check
 from ros_license_toolkit.package import Package
 
+# where downloaded schemas are stored
+SCHEMA_CACHE_DIR = os.path.expanduser("~/.cache/ros_license_toolkit")
+
 
 class SchemaCheck(Check):
     """This checks the xml scheme and returns the version number."""
@@ -80,21 +84,30 @@ class SchemaCheck(Check):
         """Return validation schema for version 1, 2 or 3. If called for other
         version numbers, this WILL FAIL. Version is not checked again.
         Only call with version 1, 2 or 3."""
-        cache_dir: str = os.path.expanduser("~/.cache/ros_license_toolkit")
-        os.makedirs(cache_dir, exist_ok=True)
-        schema_file = os.path.join(cache_dir, f"package_format{version}.xsd")
-
-        if not os.path.exists(schema_file):
-            address = f"http://download.ros.org/schema/package_format{version}.xsd"
-            try:
-                schema = etree.parse(address)
-                with open(schema_file, "wb") as f:
-                    f.write(etree.tostring(schema))
-            except (AttributeError, etree.XMLSyntaxError) as error:
-                print(error)
-                print("An error encountered while getting " + address)
-        else:
-            schema = etree.parse(schema_file)
-
-        self.validation_schema = etree.XMLSchema(schema)
+        self.validation_schema = _load_validation_schema(version)
         return self.validation_schema
+
+
+@lru_cache(maxsize=None)
+def _load_validation_schema(version: int) -> Optional[etree.XMLSchema]:
+    """Load the validation schema for `version` from the cache or download
+    it. This is only done once per process and version, as compiling the
+    schema is expensive. Return None if it can not be downloaded."""
+    schema_file = os.path.join(SCHEMA_CACHE_DIR, f"package_format{version}.xsd")
+
+    if not os.path.exists(schema_file):
+        address = f"http://download.ros.org/schema/package_format{version}.xsd"
+        try:
+            schema = etree.parse(address)
+            # the folder is only needed when a schema has to be stored
+            os.makedirs(SCHEMA_CACHE_DIR, exist_ok=True)
+            # write the parsed tree directly, no need to serialize it first
+            schema.write(schema_file)
+        except (AttributeError, etree.XMLSyntaxError, OSError) as error:
+            print(error)
+            print("An error encountered while getting " + address)
+            return None
+    else:
+        schema = etree.parse(schema_file)
+
+    return etree.XMLSchema(schema)
@@ -20,37 +20,97 @@ license tags in package.xml files.
 """
 
 import os
+import sys
 import xml.etree.ElementTree as ET
+from functools import lru_cache
 from glob import glob
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Union
 
 from license_expression import get_spdx_licensing
+from lxml import etree
 
+# characters that make a string a glob pattern, rather than a plain path
+GLOB_SPECIAL_CHARS = "*?["
 
+
+@lru_cache(maxsize=None)
+def _get_spdx_license_names() -> FrozenSet[str]:
+    """Get the names of all licenses in the SPDX list.
+    This is only built once, because building the SPDX licensing is
+    expensive."""
+    return frozenset(get_spdx_licensing().known_symbols)
+
+
+@lru_cache(maxsize=None)
 def is_license_name_in_spdx_list(license_name: str) -> bool:
     """Check if a license name is in the SPDX list of licenses."""
-    return license_name in get_spdx_licensing().known_symbols
+    return license_name in _get_spdx_license_names()
+
+
+def _get_relpath(fpath: str, pkg_path: str) -> str:
+    """Get `fpath` relative to `pkg_path`. For paths inside of `pkg_path`,
+    this is only string manipulation and avoids the overhead of
+    `os.path.relpath`. The result is interned, as it is compared to the
+    names of scanned files."""
+    prefix = os.path.join(pkg_path, "")
+    if fpath.startswith(prefix):
+        return sys.intern(os.path.normpath(fpath[len(prefix) :]))
+    return sys.intern(os.path.relpath(fpath, pkg_path))
 
 
 def _eval_glob(glob_str: str, pkg_path: str) -> Set[str]:
     """Evaluate a glob string and return a set of matching relative paths."""
+    if not any(c in glob_str for c in GLOB_SPECIAL_CHARS):
+        # a plain path, no need to list any directories
+        fpath = os.path.join(pkg_path, glob_str)
+        return {_get_relpath(fpath, pkg_path)} if os.path.isfile(fpath) else set()
     return {
-        os.path.relpath(fpath, pkg_path)
+        _get_relpath(fpath, pkg_path)
         for fpath in glob(os.path.join(pkg_path, glob_str), recursive=True)
         if os.path.isfile(fpath)
     }
 
 
+def get_all_files(pkg_path: str) -> List[str]:
+    """Return the relative paths of all files in the package, including
+    hidden ones. They are interned, as they are compared to the names of
+    scanned files."""
+    prefix_len = len(os.path.join(pkg_path, ""))
+    return [
+        sys.intern(os.path.join(root, f)[prefix_len:])
+        for root, _, files in os.walk(pkg_path)
+        for f in files
+    ]
+
+
+def get_non_hidden_files(pkg_path: str) -> Set[str]:
+    """Return the relative paths of the files in the package that the
+    glob `**` matches: regular files, and symlinks to them, that are not
+    hidden and not in hidden folders. Like the glob, this also descends
+    into symlinked folders. The paths are interned, as they are compared
+    to the names of scanned files."""
+    prefix_len = len(os.path.join(pkg_path, ""))
+    files = set()
+    for root, dirs, fnames in os.walk(pkg_path, followlinks=True):
+        dirs[:] = [d for d in dirs if not d.startswith(".")]
+        for fname in fnames:
+            fpath = os.path.join(root, fname)
+            if not fname.startswith(".") and os.path.isfile(fpath):
+                files.add(sys.intern(fpath[prefix_len:]))
+    return files
+
+
 class LicenseTag:
     """A license tag found in a package.xml file."""
 
     def __init__(
         self,
-        element: ET.Element,
+        element: Union[ET.Element, etree._Element],  # pylint: disable=protected-access
         pkg_path: str,
         license_file_scan_results: Optional[Dict[str, Any]] = None,
     ):
-        """Initialize a license tag from an XML element."""
+        """Initialize a license tag from an XML element, as from lxml or
+        the stdlib ElementTree."""
         self.element = element
         assert self.element.text is not None, "License tag must have text."
 
@@ -64,7 +124,8 @@ class LicenseTag:
         # If the license name is not in the SPDX list,
         # we assume it is a custom license and use the name as-is.
         # This will be detected in `LicenseTagIsInSpdxListCheck`.
-        self.id = raw_license_name
+        # The id is interned, as it is compared and hashed a lot.
+        self.id = sys.intern(raw_license_name)
         # If a file is linked to the tag, set its id for internal checks
         if license_file_scan_results:
             self.id_from_license_text = get_id_from_license_text(license_file_scan_results)
@@ -74,16 +135,16 @@ class LicenseTag:
         self.license_text_file: Optional[str] = element.attrib.get("file", None)
 
         # Paths to the source files that are licensed under this license
-        self._source_files: Optional[Set[str]] = None
+        self._source_files: Optional[FrozenSet[str]] = None
         self.source_files_str: str = element.attrib.get("source-files", "")
         if not self.source_files_str:
             # If no source-files attribute is given, assume all files
             # are licensed under this license.
             self.source_files_str = "**"
         else:
-            self._source_files = set()
-            for src_glob in self.source_files_str.split(" "):
-                self._source_files.update(_eval_glob(src_glob, pkg_path))
+            self._source_files = frozenset().union(
+                *(_eval_glob(src_glob, pkg_path) for src_glob in self.source_files_str.split(" "))
+            )
 
         # Path of package file this is in
         self.package_path: str = pkg_path
@@ -112,7 +173,7 @@ class LicenseTag:
         return self.license_text_file
 
     @property
-    def source_files(self) -> Set[str]:
+    def source_files(self) -> FrozenSet[str]:
         """Return the source-files attribute."""
         assert self._source_files is not None, "License tag must have source-files attribute."
         return self._source_files
@@ -121,12 +182,15 @@ class LicenseTag:
         """Make this the main license for the package."""
         assert not self.has_source_files(), "This must not have a source-files, yet."
         assert self.source_files_str == "**", "This must have a source-files attribute of '**'."
-        source_files = _eval_glob(self.source_files_str, self.package_path)
-        for other_license in other_licenses:
-            if other_license == self:
-                continue
-            source_files -= other_license.source_files
-        self._source_files = source_files
+        source_files = get_non_hidden_files(self.package_path)
+        source_files -= set().union(
+            *(
+                other_license.source_files
+                for other_license in other_licenses
+                if other_license != self
+            )
+        )
+        self._source_files = frozenset(source_files)
 
 
 def get_id_from_license_text(license_file_scan_result: Dict[str, Any]) -> str:
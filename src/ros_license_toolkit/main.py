@@ -19,12 +19,17 @@ Module containing the entry point for the ros_license_toolkit CLI.
 """
 
 import argparse
+import io
 import os
 import sys
 import timeit
-from typing import Optional, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from itertools import repeat
+from typing import Dict, Optional, Sequence, Tuple
 
 from ros_license_toolkit.checks import Status
+from ros_license_toolkit.common import get_available_cpus
 from ros_license_toolkit.license_checks.license_file_referenced_check import (
     LicenseFilesReferencedCheck,
 )
@@ -33,7 +38,8 @@ from ros_license_toolkit.license_checks.license_tag_exists_check import LicenseT
 from ros_license_toolkit.license_checks.license_tag_is_spdx import LicenseTagIsInSpdxListCheck
 from ros_license_toolkit.license_checks.license_text_exists_check import LicenseTextExistsCheck
 from ros_license_toolkit.license_checks.schema_check import SchemaCheck
-from ros_license_toolkit.package import get_packages_in_path
+from ros_license_toolkit.package import Package, get_packages_in_path
+from ros_license_toolkit.scan_cache import prune_scan_caches
 from ros_license_toolkit.ui_elements import (
     FAILURE_STR,
     SUCCESS_STR,
@@ -61,7 +67,10 @@ def main(args: Optional[Sequence[str]] = None) -> int:
         description="Checks ROS packages for correct license declaration."
     )
     parser.add_argument(
-        "path", default=".", help="path to ROS2 package or repo containing packages"
+        "path",
+        default=".",
+        type=_existing_path,
+        help="path to ROS2 package or repo containing packages",
     )
     parser.add_argument(
         "-c",
@@ -100,6 +109,23 @@ def main(args: Optional[Sequence[str]] = None) -> int:
         default=False,
         help="treats all warnings as errors",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_jobs,
+        default=0,
+        help="number of parallel processes, for several packages to "
+        + "check them in parallel, for one package to scan its files "
+        + "in parallel, 0 for all available CPUs (default)",
+    )
+    parser.add_argument(
+        "-f",
+        "--fail_fast",
+        action="store_true",
+        default=False,
+        help="stop checking a package at its first failed check, "
+        + "e.g. to skip the expensive scans",
+    )
     parsed_args = parser.parse_args(args)
 
     # Determine the verbosity level
@@ -111,12 +137,9 @@ def main(args: Optional[Sequence[str]] = None) -> int:
         verbosity = Verbosity.NORMAL
     rll_print = rll_print_factory(verbosity)
 
-    # Sanity check the path
-    assert isinstance(parsed_args.path, str)
-    assert os.path.exists(parsed_args.path), f"Path {parsed_args.path} does not exist."
-
     # Get the packages in the path
-    packages = get_packages_in_path(parsed_args.path)
+    jobs = parsed_args.jobs or get_available_cpus()
+    packages = get_packages_in_path(parsed_args.path, jobs)
     if not packages:
         rll_print(f"No packages found in {parsed_args.path}", Verbosity.QUIET)
         return os.EX_USAGE
@@ -129,8 +152,21 @@ def main(args: Optional[Sequence[str]] = None) -> int:
 
     # Check the packages
     results_per_package = {}
-    for package in packages:
-        results_per_package.update(process_one_pkg(rll_print, package))
+    if jobs > 1 and len(packages) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for results, output in pool.map(
+                process_one_pkg_captured,
+                packages,
+                repeat(verbosity),
+                repeat(parsed_args.fail_fast),
+            ):
+                print(output, end="")
+                results_per_package.update(results)
+    else:
+        for package in packages:
+            results_per_package.update(
+                process_one_pkg(rll_print, package, verbosity, parsed_args.fail_fast)
+            )
 
     if parsed_args.generate_copyright_file:
         if max(results_per_package.values()) != Status.FAILURE:
@@ -144,10 +180,27 @@ def main(args: Optional[Sequence[str]] = None) -> int:
     stop = timeit.default_timer()
     rll_print(f"Execution time: {stop - start:.2f} seconds", Verbosity.QUIET)
 
+    # keep the scan cache from growing forever
+    prune_scan_caches()
+
     # Print the overall results
     return print_results(results_per_package, rll_print, parsed_args)
 
 
+def _existing_path(path: str) -> str:
+    """Argument type for paths that must exist."""
+    if not os.path.exists(path):
+        raise argparse.ArgumentTypeError(f"Path {path} does not exist.")
+    return path
+
+
+def _jobs(jobs: str) -> int:
+    """Argument type for the number of parallel processes."""
+    if not jobs.isdigit():
+        raise argparse.ArgumentTypeError(f"Invalid number of jobs: {jobs}")
+    return int(jobs)
+
+
 def generate_copyright_file(packages, rll_print):
     """Generate copyright file. In case more than one package
     is provided, display error message."""
@@ -163,11 +216,12 @@ def generate_copyright_file(packages, rll_print):
 
 def print_results(result, rll_print, args):
     """Printing the result of package"""
-    if max(result.values()) == Status.SUCCESS:
+    worst_status = max(result.values())
+    if worst_status == Status.SUCCESS:
         rll_print(f"All packages:\n {SUCCESS_STR}", Verbosity.QUIET)
         return os.EX_OK
 
-    if max(result.values()) == Status.WARNING:
+    if worst_status == Status.WARNING:
         if args.warnings_as_error:
             rll_print(
                 f"All packages:\n {FAILURE_STR} " + "(Treating warnings as failure)",
@@ -187,8 +241,11 @@ def print_results(result, rll_print, args):
     return os.EX_DATAERR
 
 
-def process_one_pkg(rll_print, package):
-    """Perform checks on one package, print results and return them."""
+def process_one_pkg(rll_print, package, verbosity=Verbosity.NORMAL, fail_fast=False):
+    """Perform checks on one package, print results and return them.
+    The verbose output of the checks is only built with `verbosity`
+    VERBOSE. With `fail_fast`, the remaining checks are skipped after a
+    failure."""
     results_per_package = {}
     rll_print(f"[{package.name}]")
     assert package.repo is not None, "Package must be in a git repo."
@@ -205,7 +262,11 @@ def process_one_pkg(rll_print, package):
     for check in checks_to_perform:
         check.check(package)
         rll_print(check)
-        rll_print(check.verbose(), Verbosity.VERBOSE)
+        if verbosity == Verbosity.VERBOSE:
+            rll_print(check.verbose(), Verbosity.VERBOSE)
+        if fail_fast and check.status == Status.FAILURE:
+            # the package failed anyway, the later checks can not change that
+            break
 
     rll_print(minor_sep())
     # Every check is successful, no warning
@@ -224,5 +285,18 @@ def process_one_pkg(rll_print, package):
     return results_per_package
 
 
+def process_one_pkg_captured(
+    package: Package, verbosity: Verbosity, fail_fast: bool = False
+) -> Tuple[Dict[str, Status], str]:
+    """Perform checks on one package, e.g. in a worker process.
+    Return the results and the output that would have been printed."""
+    output = io.StringIO()
+    with redirect_stdout(output):
+        results_per_package = process_one_pkg(
+            rll_print_factory(verbosity), package, verbosity, fail_fast
+        )
+    return results_per_package, output.getvalue()
+
+
 if __name__ == "__main__":
     sys.exit(main(sys.argv[1:]))
@@ -19,9 +19,10 @@ This module contains the Package class.
 
 import fnmatch
 import os
-import xml.etree.ElementTree as ET
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Callable, Dict, List, Optional
 
+from licensedcode.cache import get_index
 from lxml import etree
 from rospkg import RosPack, list_by_path
 from rospkg.common import PACKAGE_FILE
@@ -29,8 +30,9 @@ from scancode.api import get_licenses
 
 from ros_license_toolkit.common import get_ignored_content, get_spdx_license_name
 from ros_license_toolkit.copyright import get_copyright_strings_per_pkg
-from ros_license_toolkit.license_tag import LicenseTag
-from ros_license_toolkit.repo import NotARepoError, Repo
+from ros_license_toolkit.license_tag import LicenseTag, get_all_files
+from ros_license_toolkit.repo import Repo, find_repo_path
+from ros_license_toolkit.scan_cache import scan_files_cached
 
 INVALID = -1
 
@@ -56,13 +58,16 @@ class Package:
     # pylint: disable=too-many-instance-attributes
     # Eight is reasonable in this case.
 
-    def __init__(self, path: str, repo: Optional[Repo] = None):
+    def __init__(self, path: str, repo: Optional[Repo] = None, scan_jobs: int = 1):
         # absolute path to this package
         self.abspath: str = path
 
         # relative path to the parent repo, if any
         self.repo: Optional[Repo] = repo
 
+        # number of processes to scan the files of this package in
+        self.scan_jobs: int = scan_jobs
+
         # name of this package by its folder name
         self.name: str = os.path.basename(self.abspath)
 
@@ -74,14 +79,14 @@ class Package:
         # this is Optional, because it is only evaluated on the first call
         self._found_license_texts: Optional[Dict[str, Any]] = None
 
-        # The xml tree of the package.xml file
-        # this is Optional, because it is only evaluated on the first call
-        self._package_xml: Optional[ET.ElementTree] = None
-
         # The license tags found in the package.xml file
         # this is Optional, because it is only evaluated on the first call
         self._license_tags: Optional[Dict[str, LicenseTag]] = None
 
+        # All files in the package, relative to its root
+        # this is Optional, because it is only evaluated on the first call
+        self._all_files: Optional[List[str]] = None
+
         # All ignored files and folders
         self._ignored_content: List[str] = get_ignored_content(self.abspath)
 
@@ -95,6 +100,14 @@ class Package:
         """Get path relative to pkg root"""
         return os.path.relpath(path, self.abspath)
 
+    @property
+    def all_files(self) -> List[str]:
+        """Get the paths of all files in the package relative to its root.
+        The package is only walked once, on the first call."""
+        if self._all_files is None:
+            self._all_files = get_all_files(self.abspath)
+        return self._all_files
+
     @property
     def found_files_w_licenses(self) -> Dict[str, Any]:
         """Get a dict of files in the package and their license scan results.
@@ -123,24 +136,20 @@ class Package:
             return
         self._found_files_w_licenses = {}
         self._found_license_texts = {}
-        for root, _, files in os.walk(self.abspath):
-            files_rel_to_pkg = [
-                self._get_path_relative_to_pkg(os.path.join(root, f)) for f in files
-            ]
-            for pattern in self._ignored_content:
-                matched = fnmatch.filter(files_rel_to_pkg, pattern)
-                for m in matched:
-                    files_rel_to_pkg.remove(m)
-            for fname in files_rel_to_pkg:
-                # Path relative to cwd
-                fpath = os.path.join(self.abspath, fname)
-                # Path relative to package root
-                scan_results = get_licenses(fpath)
-                if get_spdx_license_name(scan_results):
-                    self._found_license_texts[fname] = scan_results
-                else:
-                    # not a license text file but also interesting
-                    self._found_files_w_licenses[fname] = scan_results
+        is_ignored = _compile_patterns(self._ignored_content)
+        fnames = [fname for fname in self.all_files if not is_ignored(fname)]
+        # Path relative to cwd by path relative to package root
+        pkg_prefix = os.path.join(self.abspath, "")
+        fpaths = {pkg_prefix + fname: fname for fname in fnames}
+        for fpath, scan_results in scan_files_cached(
+            "licenses", get_licenses, list(fpaths), warm_up=get_index, jobs=self.scan_jobs
+        ).items():
+            fname = fpaths[fpath]
+            if get_spdx_license_name(scan_results):
+                self._found_license_texts[fname] = scan_results
+            else:
+                # not a license text file but also interesting
+                self._found_files_w_licenses[fname] = scan_results
         # look also in the repo for license text files
         if self.repo is not None:
             for path, res in self.repo.license_text_files.items():
@@ -148,63 +157,52 @@ class Package:
 
     @property
     def package_xml(self):
-        """Get xml of `package.xml` as `ElementTree` object."""
-        if self._package_xml is None:
-            self._package_xml = ET.parse(os.path.join(self.abspath, "package.xml"))
-        return self._package_xml
+        """Get xml of `package.xml` as `ElementTree` object.
+        This shares the lxml parse of `parsed_package_xml`."""
+        return self.parsed_package_xml
 
     def _check_single_license_tag_without_source_files(self):
         """One license tag can have no source-files attribute.
         But there can be only one such tag.
         This is then the main license."""
-        if len(list(filter(lambda x: not x.has_source_files(), self._license_tags.values()))) > 1:
+        tags = list(self._license_tags.values())
+        tags_without_source_files = [tag for tag in tags if not tag.has_source_files()]
+        if len(tags_without_source_files) > 1:
             raise MoreThanOneLicenseWithoutSourceFilesTag(
                 "There must be at most one license tag without source-files."
             )
-        for tag in self._license_tags.values():
-            if not tag.has_source_files():
-                tag.make_this_the_main_license(list(self._license_tags.values()))
-                break
+        if tags_without_source_files:
+            tags_without_source_files[0].make_this_the_main_license(tags)
 
     def _check_single_license_tag_without_file_attribute(self):
         """One license tag can have no file attribute, but only one.
         It may be associated to a license text file in the package or
         the repo."""
-        if (
-            len(
-                list(
-                    filter(
-                        lambda x: not x.has_license_text_file(),
-                        self._license_tags.values(),
-                    )
-                )
-            )
-            > 1
-        ):
+        tags_without_license_text_file = [
+            tag for tag in self._license_tags.values() if not tag.has_license_text_file()
+        ]
+        if len(tags_without_license_text_file) > 1:
             raise MoreThanOneLicenseWithoutLicenseTextFile(
                 "There must be at most one license tag without a license text file."
             )
-        for tag in self._license_tags.values():
-            if not tag.has_license_text_file():
-                license_texts = self.found_license_texts
-                if len(license_texts) == 1:
-                    tag.license_text_file = list(license_texts.keys())[0]
-                else:
-                    for license_text_file in license_texts:
-                        if "LICENSE" in license_text_file:
-                            tag.license_text_file = license_text_file
-                            break
-                # there was no license text found by content, but we can
-                # look for some files by their name, e.g. LICENSE or COPYING
-                potential_license_files = [
-                    file
-                    for file in os.listdir(self.abspath)
-                    if "LICENSE" in file or "COPYING" in file
-                ]
-                # only if there is exactly one such file, we can use it
-                if len(potential_license_files) == 1:
-                    tag.license_text_file = potential_license_files[0]
-                break
+        if tags_without_license_text_file:
+            tag = tags_without_license_text_file[0]
+            license_texts = self.found_license_texts
+            if len(license_texts) == 1:
+                tag.license_text_file = list(license_texts.keys())[0]
+            else:
+                for license_text_file in license_texts:
+                    if "LICENSE" in license_text_file:
+                        tag.license_text_file = license_text_file
+                        break
+            # there was no license text found by content, but we can
+            # look for some files by their name, e.g. LICENSE or COPYING
+            potential_license_files = [
+                file for file in os.listdir(self.abspath) if "LICENSE" in file or "COPYING" in file
+            ]
+            # only if there is exactly one such file, we can use it
+            if len(potential_license_files) == 1:
+                tag.license_text_file = potential_license_files[0]
 
     def _check_for_single_tag_without_file(self):
         """Set the id_from_license_text if only one tag and one
@@ -262,9 +260,8 @@ class Package:
     def parsed_package_xml(self) -> etree:
         """Returns the package.xml content parsed as etree."""
         if self._parsed_package_xml is None:
-            path = self.abspath + "/package.xml"
-            assert os.path.exists(path), f"Path {path} does not exist."
-            self._parsed_package_xml = etree.parse(path)
+            # packages are found by their package.xml, so it exists
+            self._parsed_package_xml = etree.parse(os.path.join(self.abspath, PACKAGE_FILE))
         return self._parsed_package_xml
 
     @property
@@ -283,21 +280,19 @@ class Package:
     def get_copyright_file_contents(self) -> str:
         """Get a string representation of the copyright notice."""
         pkg_copyright_strings = get_copyright_strings_per_pkg(self)
-        cpr_str = "".join(
-            (
-                "Format: https://www.debian.org/doc/packaging-manuals/copyright",
-                "-format/1.0/\n",
-                f"Source: {self.repo_url}\n",
-                f"Upstream-Name: {self.name}\n\n",
-            )
-        )
+        parts = [
+            "Format: https://www.debian.org/doc/packaging-manuals/copyright",
+            "-format/1.0/\n",
+            f"Source: {self.repo_url}\n",
+            f"Upstream-Name: {self.name}\n\n",
+        ]
         for key, cprs in pkg_copyright_strings.items():
             source_files_str = self.license_tags[key].source_files_str
-            cpr_str += f"Files:\n {source_files_str}\n"
-            cpr_str += "Copyright: "
-            cpr_str += "\n           ".join(cprs)
+            parts.append(f"Files:\n {source_files_str}\n")
+            parts.append("Copyright: ")
+            parts.append("\n           ".join(cprs))
             pkg_license = self.license_tags[key]
-            cpr_str += f"\nLicense: {pkg_license.id}\n"
+            parts.append(f"\nLicense: {pkg_license.id}\n")
             assert pkg_license.license_text_file, "License text file must be defined."
             license_path = os.path.join(self.abspath, pkg_license.license_text_file)
             if not os.path.exists(license_path):
@@ -305,14 +300,11 @@ class Package:
                     ("Cannot create copyright file." f"File {license_path} does not exist.")
                 )
             with open(license_path, encoding="utf-8") as f:
-                license_lines = f.readlines()
-            for line in license_lines:
-                out_line = f" {line}"
-                # remove leading whitespace from empty lines
-                if out_line == " \n":
-                    out_line = "\n"
-                cpr_str += out_line
-            cpr_str += "\n"
+                for line in f:
+                    # remove leading whitespace from empty lines
+                    parts.append("\n" if line == "\n" else f" {line}")
+            parts.append("\n")
+        cpr_str = "".join(parts)
         # remove double newlines at the end
         if cpr_str.endswith("\n\n"):
             cpr_str = cpr_str[:-1]
@@ -324,14 +316,41 @@ class Package:
             f.write(self.get_copyright_file_contents())
 
 
-def get_packages_in_path(path: str) -> List[Package]:
-    """Get all ROS packages in a given path."""
+def _compile_patterns(patterns: List[str]) -> Callable[[str], bool]:
+    """Return a function that checks if a path matches any of the
+    fnmatch `patterns`. They are combined into one regex, so that each
+    path is only matched once."""
+    if not patterns:
+        return lambda _: False
+    regex = re.compile("|".join([fnmatch.translate(pattern) for pattern in patterns]))
+    return lambda path: regex.match(path) is not None
+
+
+def get_packages_in_path(path: str, jobs: int = 1) -> List[Package]:
+    """Get all ROS packages in a given path.
+
+    :param path: Path to search for packages in.
+    :type path: str
+    :param jobs: Number of processes to scan files in. Several packages
+        are checked in parallel instead, so then only the files of their
+        repos are scanned in parallel, defaults to 1
+    :type jobs: int
+    """
     packages = []
-    try:
-        repo: Optional[Repo] = Repo(os.path.abspath(path))
-    except NotARepoError:
-        repo = None
-    for pkg in list_by_path(PACKAGE_FILE, path, {}):
-        ros_pkg = RosPack([path]).get_path(pkg)
-        packages.append(Package(ros_pkg, repo))
+    # one Repo per git repo, shared by all packages in it, so that its
+    # files are only scanned once
+    repos: Dict[Optional[str], Optional[Repo]] = {None: None}
+    # one RosPack for all packages, so that the path is only crawled once
+    rospack = RosPack([path])
+    # packages too deep in their repo to find it from their own path
+    # belong to the repo found from the given path
+    path_repo_path = find_repo_path(path)
+    pkg_names = list_by_path(PACKAGE_FILE, path, {})
+    pkg_scan_jobs = jobs if len(pkg_names) == 1 else 1
+    for pkg in pkg_names:
+        pkg_path = rospack.get_path(pkg)
+        repo_path = find_repo_path(pkg_path) or path_repo_path
+        if repo_path is not None and repo_path not in repos:
+            repos[repo_path] = Repo(repo_path, scan_jobs=jobs)
+        packages.append(Package(pkg_path, repos[repo_path], scan_jobs=pkg_scan_jobs))
     return packages
@@ -22,9 +22,11 @@ import os
 from typing import Any, Dict, Optional
 
 import git
+from licensedcode.cache import get_index
 from scancode.api import get_licenses
 
 from ros_license_toolkit.common import get_spdx_license_name
+from ros_license_toolkit.scan_cache import scan_files_cached
 
 # how many folders up to search for a repo
 REPO_SEARCH_DEPTH = 5
@@ -35,6 +37,17 @@ def is_git_repo(path: str) -> bool:
     return os.path.isdir(os.path.join(path, ".git"))
 
 
+def find_repo_path(path: str) -> Optional[str]:
+    """Find the git repo that `path` is in, searching up to
+    `REPO_SEARCH_DEPTH` folders up. Return its absolute path or None."""
+    search_path = os.path.abspath(path)
+    for _ in range(REPO_SEARCH_DEPTH + 1):
+        if is_git_repo(search_path):
+            return search_path
+        search_path = os.path.dirname(search_path)
+    return None
+
+
 class NotARepoError(Exception):
     """Exception raised when we can't find a repo."""
 
@@ -42,42 +55,31 @@ class NotARepoError(Exception):
 class Repo:
     """Represents a git repository."""
 
-    def __init__(self, package_path: str):
+    def __init__(self, path: str, scan_jobs: int = 1):
         """Initialize a Repo object.
 
-        :param package_path: Absolute path to the package.
-        :type package_path: str
+        :param path: Path to the repo or to a folder in it, e.g. a package.
+        :type path: str
+        :param scan_jobs: Number of processes to scan the repo's files in.
+        :type scan_jobs: int
         """
-
-        # absolute path to the package
-        self.abs_package_path: str = package_path
-
-        # repo path relative to the package
-        relpath: Optional[str] = None
-        search_path = package_path
-        for _ in range(REPO_SEARCH_DEPTH + 1):
-            if is_git_repo(search_path):
-                relpath = os.path.relpath(search_path, self.abs_package_path)
-                break
-            search_path = os.path.dirname(search_path)
-
-        if relpath is None:
+        repo_path = find_repo_path(path)
+        if repo_path is None:
             raise NotARepoError("No git repo found for package.")
 
         # absolute path to the repo
-        self.abs_path: str = os.path.normpath(os.path.join(self.abs_package_path, relpath))
+        self.abs_path: str = os.path.normpath(repo_path)
 
         # (for logging purposes) the current git hash
-        repo = git.Repo(search_path)
+        repo = git.Repo(self.abs_path)
         self.git_hash: str = repo.head.object.hexsha
 
         # scan files in the repo
         self.license_text_files: Dict[str, Dict[str, Any]] = {}
-        for file in os.scandir(self.abs_path):
-            fpath = os.path.join(self.abs_path, file)
-            if not os.path.isfile(fpath):
-                continue
-            scan_results = get_licenses(fpath)
+        fpaths = [entry.path for entry in os.scandir(self.abs_path) if entry.is_file()]
+        for fpath, scan_results in scan_files_cached(
+            "licenses", get_licenses, fpaths, warm_up=get_index, jobs=scan_jobs
+        ).items():
             if get_spdx_license_name(scan_results):
                 if "ros_license_toolkit/LICENSE" not in fpath:
                     self.license_text_files[fpath] = scan_results
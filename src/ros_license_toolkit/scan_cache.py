@@ -0,0 +1,213 @@
+# Copyright (c) 2026 - for information on the respective copyright owner
+# see the NOTICE file and/or the repository
+# https://github.com/boschresearch/ros_license_toolkit
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains a cache for scan results that persists across runs.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from scancode_config import __version__ as scancode_version
+
+from ros_license_toolkit import __version__
+from ros_license_toolkit.common import scan_files
+
+# where to store the caches, in one folder per version
+CACHE_DIR = os.path.expanduser("~/.cache/ros_license_toolkit/scans")
+
+# results depend on both the scancode version and the post-processing of
+# this toolkit, so they are only used by the same versions of both
+CACHE_VERSION = f"scancode-{scancode_version}_ros_license_toolkit-{__version__}"
+
+# if this environment variable is set, no cache is used
+NO_CACHE_ENV_VAR = "ROS_LICENSE_TOOLKIT_NO_CACHE"
+
+# entries that were not used for this long (in seconds) are removed
+MAX_ENTRY_AGE = 30 * 24 * 60 * 60
+
+# how often (in seconds) to look for entries to remove
+PRUNE_INTERVAL = 24 * 60 * 60
+
+# size of the blocks in which files are read for hashing
+HASH_BLOCK_SIZE = 65536
+
+
+def get_file_hash(fpath: str) -> str:
+    """Get the sha256 hash of the content of the file at `fpath`."""
+    sha = hashlib.sha256()
+    with open(fpath, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def is_cache_enabled() -> bool:
+    """Check if the cache is used, i.e. not disabled by `NO_CACHE_ENV_VAR`."""
+    return not os.environ.get(NO_CACHE_ENV_VAR)
+
+
+def _get_options_hash(options: Optional[Dict[str, Any]]) -> str:
+    """Get a short hash of the `options` a scan function is called with."""
+    options_str = json.dumps(options or {}, sort_keys=True, default=repr)
+    return hashlib.sha256(options_str.encode("utf-8")).hexdigest()[:16]
+
+
+def _get_scan_options(scan_function: Callable[..., Any]) -> Optional[Dict[str, Any]]:
+    """Get the options that are bound to `scan_function` by a
+    `functools.partial`, if any."""
+    if not isinstance(scan_function, functools.partial):
+        return None
+    options = dict(scan_function.keywords)
+    if scan_function.args:
+        options["*args"] = scan_function.args
+    return options
+
+
+class ScanCache:
+    """Scan results stored on disk, in one file per scanned file content,
+    named by the hash of that content. Entries are only read when they
+    are needed, and writing one never touches the others, so concurrent
+    runs and worker processes do not lose each other's results. Results
+    of other versions of scancode or this toolkit, or of scans with other
+    options, are not used."""
+
+    def __init__(self, name: str, options: Optional[Dict[str, Any]] = None):
+        """Use the cache called `name` on disk.
+
+        :param name: Name of the cache, e.g. the kind of scan it stores.
+        :type name: str
+        :param options: Options the scan function is called with,
+            defaults to None
+        :type options: Optional[Dict[str, Any]]
+        """
+        # folder this cache is stored in
+        self.path: str = os.path.join(
+            CACHE_DIR, CACHE_VERSION, f"{name}_{_get_options_hash(options)}"
+        )
+
+    def _get_entry_path(self, file_hash: str) -> str:
+        """Get the path of the entry for `file_hash`. Entries are spread
+        over subfolders, so that no folder gets too large."""
+        return os.path.join(self.path, file_hash[:2], f"{file_hash}.json")
+
+    def get(self, file_hash: str) -> Optional[Dict[str, Any]]:
+        """Get the cached results for a file with hash `file_hash`.
+        Return None if there are none. Every call reads a new copy, so
+        that callers can add to it without changing the cache."""
+        entry_path = self._get_entry_path(file_hash)
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                results = json.load(f)
+            # mark the entry as used, so that it is not pruned
+            os.utime(entry_path)
+        except (OSError, ValueError):
+            return None
+        return results
+
+    def set(self, file_hash: str, results: Dict[str, Any]):
+        """Store the `results` for a file with hash `file_hash`. The cache
+        only saves time, so if it can not be written, this does nothing."""
+        entry_path = self._get_entry_path(file_hash)
+        entry_dir = os.path.dirname(entry_path)
+        try:
+            os.makedirs(entry_dir, exist_ok=True)
+            # write to a temporary file first, so that concurrent runs never
+            # read a partially written entry
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=entry_dir, delete=False, suffix=".tmp"
+            ) as f:
+                json.dump(results, f)
+            os.replace(f.name, entry_path)
+        except OSError:
+            pass
+
+
+def prune_scan_caches():
+    """Remove the caches of other versions and the entries that
+    were not used for `MAX_ENTRY_AGE`. This only looks at the entries
+    once per `PRUNE_INTERVAL`, so that it does not slow down every run."""
+    if not is_cache_enabled() or not os.path.isdir(CACHE_DIR):
+        return
+    now = time.time()
+    marker = os.path.join(CACHE_DIR, "last_pruned")
+    try:
+        if now - os.stat(marker).st_mtime < PRUNE_INTERVAL:
+            return
+    except FileNotFoundError:
+        pass
+    try:
+        with open(marker, "w", encoding="utf-8"):
+            pass
+    except OSError:
+        return
+    for entry in os.scandir(CACHE_DIR):
+        if entry.is_dir() and entry.name != CACHE_VERSION:
+            shutil.rmtree(entry.path, ignore_errors=True)
+    for root, _, fnames in os.walk(os.path.join(CACHE_DIR, CACHE_VERSION)):
+        for fname in fnames:
+            fpath = os.path.join(root, fname)
+            try:
+                if now - os.stat(fpath).st_mtime > MAX_ENTRY_AGE:
+                    os.remove(fpath)
+            except OSError:
+                continue
+
+
+def scan_files_cached(
+    cache_name: str,
+    scan_function: Callable[[str], Dict[str, Any]],
+    fpaths: List[str],
+    warm_up: Optional[Callable[[], Any]] = None,
+    jobs: int = 1,
+) -> Dict[str, Dict[str, Any]]:
+    """Get the results of `scan_function` for all `fpaths`, like
+    `scan_files`, which also explains `warm_up` and `jobs`. Only files whose
+    content is not in the cache called `cache_name` are actually scanned.
+    New results are stored in the cache. Paths that are no regular,
+    readable files, e.g. dangling symlinks, are scanned without the cache.
+    To scan with options, pass a `functools.partial` of the scan function.
+    Results of scans with other options are cached separately."""
+    if not is_cache_enabled():
+        return scan_files(scan_function, fpaths, warm_up, jobs)
+    cache = ScanCache(cache_name, _get_scan_options(scan_function))
+    file_hashes: Dict[str, str] = {}
+    for fpath in fpaths:
+        if not os.path.isfile(fpath):
+            continue
+        try:
+            file_hashes[fpath] = get_file_hash(fpath)
+        except OSError:
+            continue
+    results: Dict[str, Dict[str, Any]] = {}
+    for fpath, file_hash in file_hashes.items():
+        cached = cache.get(file_hash)
+        if cached is not None:
+            results[fpath] = cached
+    for fpath, res in scan_files(
+        scan_function, [f for f in fpaths if f not in results], warm_up, jobs
+    ).items():
+        if fpath in file_hashes:
+            cache.set(file_hashes[fpath], res)
+        results[fpath] = res
+    # keep the order of `fpaths`
+    return {fpath: results[fpath] for fpath in fpaths}
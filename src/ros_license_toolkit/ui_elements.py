@@ -18,6 +18,7 @@
 This module contains UI elements for the CLI.
 """
 
+import os
 from enum import Enum, auto
 
 # colors
@@ -27,20 +28,23 @@ YELLOW = "\033[93m"
 RED = "\033[91m"
 NC = "\033[00m"
 
+# colors are disabled by setting NO_COLOR, see https://no-color.org
+USE_COLORS = not os.environ.get("NO_COLOR")
+
 
 def red(message: str):
     """Make this `message` red"""
-    return f"{RED}{message}{NC}"
+    return f"{RED}{message}{NC}" if USE_COLORS else message
 
 
 def yellow(message: str):
     """Make this `message` yellow"""
-    return f"{YELLOW}{message}{NC}"
+    return f"{YELLOW}{message}{NC}" if USE_COLORS else message
 
 
 def green(message: str):
     """Make this `message` green"""
-    return f"{GREEN}{message}{NC}"
+    return f"{GREEN}{message}{NC}" if USE_COLORS else message
 
 
 # further UI elements
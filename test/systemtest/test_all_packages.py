@@ -22,6 +22,44 @@ import os
 import subprocess
 import unittest
 
+# names of all packages in the test directory
+EXPECTED_PACKAGES = [
+    "test_pkg_deep",
+    "test_pkg_both_tags_not_spdx",
+    "test_pkg_both_tags_not_spdx_one_file_own",
+    "test_pkg_code_has_no_license",
+    "test_pkg_has_code_disjoint",
+    "test_pkg_has_code_of_different",
+    "test_pkg_has_code_of_different_license",
+    "test_pkg_has_code_of_different_license_and_tag",
+    "test_pkg_has_code_of_different_license_and_wrong_tag",
+    "test_pkg_ignore_readme_contents",
+    "test_pkg_name_not_in_spdx",
+    "test_pkg_no_file_attribute",
+    "test_pkg_no_license",
+    "test_pkg_no_license_file",
+    "test_pkg_one_correct_one_license_file_missing",
+    "test_pkg_scheme1_conform",
+    "test_pkg_scheme1_violation",
+    "test_pkg_scheme2_conform",
+    "test_pkg_scheme2_violation",
+    "test_pkg_scheme3_conform",
+    "test_pkg_scheme3_violation",
+    "test_pkg_spdx_tag",
+    "test_pkg_too_many_license_files",
+    "test_pkg_tag_not_spdx",
+    "test_pkg_unknown_license",
+    "test_pkg_unknown_license_missing_file",
+    "test_pkg_with_license_and_file",
+    "test_pkg_with_multiple_licenses_no_source_files_tag",
+    "test_pkg_with_multiple_licenses_one_referenced_incorrect",
+    "test_pkg_wrong_license_file",
+    "pkg_with_bsd3_a",
+    "pkg_with_bsd3_b",
+    "pkg_with_mit_a",
+    "pkg_with_mit_b",
+]
+
 
 class TestAllPackages(unittest.TestCase):
     """Test the linter on all packages in the test directory."""
@@ -39,40 +77,20 @@ class TestAllPackages(unittest.TestCase):
         self.assertNotEqual(os.EX_OK, process.returncode)
         print(stdout)
         print(stderr)
-        self.assertIn(b"test_pkg_deep", stdout)
-        self.assertIn(b"test_pkg_both_tags_not_spdx", stdout)
-        self.assertIn(b"test_pkg_both_tags_not_spdx_one_file_own", stdout)
-        self.assertIn(b"test_pkg_code_has_no_license", stdout)
-        self.assertIn(b"test_pkg_has_code_disjoint", stdout)
-        self.assertIn(b"test_pkg_has_code_of_different", stdout)
-        self.assertIn(b"test_pkg_has_code_of_different_license", stdout)
-        self.assertIn(b"test_pkg_has_code_of_different_license_and_tag", stdout)
-        self.assertIn(b"test_pkg_has_code_of_different_license_and_wrong_tag", stdout)
-        self.assertIn(b"test_pkg_ignore_readme_contents", stdout)
-        self.assertIn(b"test_pkg_name_not_in_spdx", stdout)
-        self.assertIn(b"test_pkg_no_file_attribute", stdout)
-        self.assertIn(b"test_pkg_no_license", stdout)
-        self.assertIn(b"test_pkg_no_license_file", stdout)
-        self.assertIn(b"test_pkg_one_correct_one_license_file_missing", stdout)
-        self.assertIn(b"test_pkg_scheme1_conform", stdout)
-        self.assertIn(b"test_pkg_scheme1_violation", stdout)
-        self.assertIn(b"test_pkg_scheme2_conform", stdout)
-        self.assertIn(b"test_pkg_scheme2_violation", stdout)
-        self.assertIn(b"test_pkg_scheme3_conform", stdout)
-        self.assertIn(b"test_pkg_scheme3_violation", stdout)
-        self.assertIn(b"test_pkg_spdx_tag", stdout)
-        self.assertIn(b"test_pkg_too_many_license_files", stdout)
-        self.assertIn(b"test_pkg_tag_not_spdx", stdout)
-        self.assertIn(b"test_pkg_unknown_license", stdout)
-        self.assertIn(b"test_pkg_unknown_license_missing_file", stdout)
-        self.assertIn(b"test_pkg_with_license_and_file", stdout)
-        self.assertIn(b"test_pkg_with_multiple_licenses_no_source_files_tag", stdout)
-        self.assertIn(b"test_pkg_with_multiple_licenses_one_referenced_incorrect", stdout)
-        self.assertIn(b"test_pkg_wrong_license_file", stdout)
-        self.assertIn(b"pkg_with_bsd3_a", stdout)
-        self.assertIn(b"pkg_with_bsd3_b", stdout)
-        self.assertIn(b"pkg_with_mit_a", stdout)
-        self.assertIn(b"pkg_with_mit_b", stdout)
+        missing = [name for name in EXPECTED_PACKAGES if name.encode() not in stdout]
+        self.assertEqual([], missing, "Packages missing in output.")
+
+    def test_path_does_not_exist(self):
+        """Call the linter on a path that does not exist.
+        Check that this is reported as a usage error."""
+        with subprocess.Popen(
+            ["ros_license_toolkit", "test/_test_data/does_not_exist"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        ) as process:
+            _, stderr = process.communicate()
+        self.assertEqual(2, process.returncode)
+        self.assertIn(b"Path test/_test_data/does_not_exist does not exist.", stderr)
 
 
 if __name__ == "__main__":
@@ -17,6 +17,7 @@
 # limitations under the License.
 
 import os
+from functools import lru_cache
 from test.systemtest._test_helpers import make_repo, remove_repo
 
 from ros_license_toolkit.copyright import get_copyright_strings_per_pkg
@@ -33,14 +34,29 @@ TEST_PACKAGES_COPYRIGHT_FILE = [
 ]
 
 
+def setup_module():
+    """Make the test data a git repo once for all tests in this module."""
+    make_repo(TEST_DATA_FOLDER)
+
+
+def teardown_module():
+    """Remove the git repo again, also if a test failed."""
+    remove_repo(TEST_DATA_FOLDER)
+
+
 def _join_copyright_strings(copyright_strings) -> str:
-    return " ".join(" ".join(copyrights) for copyrights in copyright_strings.values())
+    return " ".join(cpr for copyrights in copyright_strings.values() for cpr in copyrights)
 
 
-def remove_existing_copyright_file(path: str):
-    """Remove existing file at path if it exists."""
-    if os.path.exists(path):
-        os.remove(path)
+@lru_cache(maxsize=None)
+def _get_expected_copyright_file(pkg_name: str) -> str:
+    """Read the expected copyright file of a package, once for all tests."""
+    with open(
+        os.path.join(TEST_DATA_FOLDER, "copyright_file_contents", pkg_name),
+        "r",
+        encoding="utf-8",
+    ) as f:
+        return f.read()
 
 
 def test_copyright():
@@ -65,40 +81,22 @@ def test_copyright_to_string():
 
 def test_get_copyright_file_contents():
     """Test if correct content in copyright file."""
-    make_repo(TEST_DATA_FOLDER)
     for pkg_name in TEST_PACKAGES_COPYRIGHT_FILE:
         pkg_path = os.path.join(TEST_DATA_FOLDER, pkg_name)
         pkg = get_packages_in_path(pkg_path)[0]
         copyright_file_content = pkg.get_copyright_file_contents()
-        with open(
-            os.path.join(TEST_DATA_FOLDER, "copyright_file_contents", pkg_name),
-            "r",
-            encoding="utf-8",
-        ) as f:
-            expected = f.read()
-            assert expected == copyright_file_content
-    remove_repo(TEST_DATA_FOLDER)
+        assert _get_expected_copyright_file(pkg_name) == copyright_file_content
 
 
-def test_write_copyright_file():
+def test_write_copyright_file(tmp_path):
     """Test if correct writing of copyright file."""
-    make_repo(TEST_DATA_FOLDER)
     for pkg_name in TEST_PACKAGES_COPYRIGHT_FILE:
         pkg_path = os.path.join(TEST_DATA_FOLDER, pkg_name)
-        copyright_file_folder = os.path.join("/tmp", pkg_name)
-        os.makedirs(name=copyright_file_folder, exist_ok=True)
-        copyright_file_path = os.path.join(copyright_file_folder, "copyright")
-        remove_existing_copyright_file(path=copyright_file_path)
+        # a fresh file per package, in a temporary folder for this test
+        copyright_file_path = str(tmp_path / f"{pkg_name}_copyright")
         pkg = get_packages_in_path(pkg_path)[0]
         pkg.write_copyright_file(copyright_file_path)
         assert os.path.exists(copyright_file_path)
         with open(copyright_file_path, "r", encoding="utf-8") as f:
             output = f.read()
-            with open(
-                os.path.join(TEST_DATA_FOLDER, "copyright_file_contents", pkg_name),
-                "r",
-                encoding="utf-8",
-            ) as f:
-                expected = f.read()
-                assert expected == output
-    remove_repo(TEST_DATA_FOLDER)
+        assert _get_expected_copyright_file(pkg_name) == output
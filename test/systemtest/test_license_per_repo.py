@@ -29,7 +29,7 @@ class TestLicensePerRepoBsd3(unittest.TestCase):
     Here a repo folder has a license text with subfolders that are packages
     using that license."""
 
-    def _test_repo(self, repo_name, pkg_names, license_name):
+    def _test_repo(self, repo_name, pkg_names, license_name, extra_args=()):
         """Test that the license per repo is detected correctly.
 
         :param repo_name: name of the test repo folder
@@ -38,13 +38,15 @@ class TestLicensePerRepoBsd3(unittest.TestCase):
         :type pkg_names: List[str]
         :param license_name: name of the license to expect
         :type license_name: str
+        :param extra_args: additional command line arguments
+        :type extra_args: Sequence[str]
         """
         # make actual git repo
         repo_path = os.path.join("test", "_test_data", repo_name)
         make_repo(repo_path)
         # test
         with subprocess.Popen(
-            ["ros_license_toolkit", repo_path],
+            ["ros_license_toolkit", repo_path, *extra_args],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
         ) as process:
@@ -65,6 +67,12 @@ class TestLicensePerRepoBsd3(unittest.TestCase):
         """Testing with MIT license text."""
         self._test_repo("test_repo_mit", ["pkg_with_mit_a", "pkg_with_mit_b"], "MIT")
 
+    def test_license_text_in_repo_parallel(self):
+        """Testing with packages checked in parallel processes."""
+        self._test_repo(
+            "test_repo_mit", ["pkg_with_mit_a", "pkg_with_mit_b"], "MIT", ["--jobs", "2"]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
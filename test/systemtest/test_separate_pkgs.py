@@ -20,7 +20,7 @@ import os
 import subprocess
 import unittest
 from test.systemtest._test_helpers import make_repo, remove_repo
-from typing import Optional
+from typing import Optional, Sequence
 
 from ros_license_toolkit.checks import Status
 
@@ -215,6 +215,17 @@ class TestPkgs(unittest.TestCase):
         self.assertEqual(os.EX_OK, process.returncode)
         self.assertTrue(check_output_status(stdout))
 
+    def test_pkg_spdx_tag_with_dangling_symlink(self):
+        """Test on a package with a symlink to a file that does not exist,
+        e.g. to a build folder. It can not be read, but must not fail
+        the checks."""
+        link_path = "test/_test_data/test_pkg_spdx_tag/compile_commands.json"
+        os.symlink("build/compile_commands.json", link_path)
+        self.addCleanup(os.remove, link_path)
+        process, stdout = open_subprocess("test_pkg_spdx_tag")
+        self.assertEqual(os.EX_OK, process.returncode)
+        self.assertTrue(check_output_status(stdout))
+
     def test_pkg_too_many_license_files(self):
         """ "Test on a package with multiple License files that are not
         declared by any tag and could therefore be removed."""
@@ -266,6 +277,16 @@ class TestPkgs(unittest.TestCase):
         self.assertEqual(os.EX_DATAERR, process.returncode)
         self.assertTrue(check_output_status(stdout, exp_lic_tag_exists=FAILURE))
 
+    def test_pkg_with_multiple_licenses_no_source_files_tag_fail_fast(self):
+        """Test that with --fail_fast, no more checks are performed after
+        the first one that failed."""
+        process, stdout = open_subprocess(
+            "test_pkg_with_multiple_licenses_no_source_files_tag", ["--fail_fast"]
+        )
+        self.assertEqual(os.EX_DATAERR, process.returncode)
+        self.assertEqual(get_test_result(stdout, "LicenseTagExistsCheck"), FAILURE)
+        self.assertNotIn(b"LicensesInCodeCheck", stdout)
+
     def test_pkg_with_multiple_licenses_one_referenced_incorrect(self):
         """Test on a package with multiple licenses declared in the
         package.xml. First has tag not in SPDX list with correct
@@ -292,10 +313,10 @@ class TestPkgs(unittest.TestCase):
         )
 
 
-def open_subprocess(test_data_name: str):
+def open_subprocess(test_data_name: str, extra_args: Sequence[str] = ()):
     """Open a subprocess to also gather cl output"""
     with subprocess.Popen(
-        ["ros_license_toolkit", "test/_test_data/" + test_data_name],
+        ["ros_license_toolkit", "test/_test_data/" + test_data_name, *extra_args],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
     ) as process:
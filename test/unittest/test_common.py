@@ -0,0 +1,53 @@
+# Copyright (c) 2026 - for information on the respective copyright owner
+# see the NOTICE file and/or the repository
+# https://github.com/boschresearch/ros_license_toolkit
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the common module"""
+
+import os
+import unittest
+
+from ros_license_toolkit.common import MIN_FILES_FOR_PARALLEL_SCAN, get_available_cpus, scan_files
+
+
+def _fake_scan(fpath):
+    """Stand-in for a scancode scan, that shows which process ran it."""
+    return {"name": os.path.basename(fpath), "pid": os.getpid()}
+
+
+class TestCommon(unittest.TestCase):
+    """Test the common module"""
+
+    def test_get_available_cpus(self):
+        """Test that there is at least one CPU, but not more than exist"""
+        self.assertGreaterEqual(get_available_cpus(), 1)
+        self.assertLessEqual(get_available_cpus(), os.cpu_count() or 1)
+
+    def test_scan_files(self):
+        """Test that scanning in parallel gives the results in order"""
+        fpaths = [f"/pkg/file_{i}" for i in range(2 * MIN_FILES_FOR_PARALLEL_SCAN)]
+        serial = scan_files(_fake_scan, fpaths)
+        self.assertEqual({os.getpid()}, {res["pid"] for res in serial.values()})
+        parallel = scan_files(_fake_scan, fpaths, jobs=2)
+        self.assertEqual(fpaths, list(parallel))
+        self.assertEqual(
+            [res["name"] for res in serial.values()],
+            [res["name"] for res in parallel.values()],
+        )
+        self.assertNotIn(os.getpid(), {res["pid"] for res in parallel.values()})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+# Copyright (c) 2026 - for information on the respective copyright owner
+# see the NOTICE file and/or the repository
+# https://github.com/boschresearch/ros_license_toolkit
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the copyright module"""
+
+import unittest
+
+from ros_license_toolkit.copyright import _clean_copyright_text
+
+
+class TestCopyright(unittest.TestCase):
+    """Test the copyright module"""
+
+    def test_clean_copyright_text(self):
+        """Test that all forms of the copyright prefix are removed"""
+        for copyright_text in [
+            "Copyright (c) 2023 Foo",
+            "Copyright (c)2023 Foo",
+            "Copyright 2023 Foo",
+            "Copyright2023 Foo",
+            "COPYRIGHT (C) 2023 Foo",
+            "copyright (C)2023 Foo",
+        ]:
+            self.assertEqual("2023 Foo", _clean_copyright_text(copyright_text), copyright_text)
+
+    def test_clean_copyright_text_no_prefix(self):
+        """Test that texts without the prefix are kept"""
+        for copyright_text in ["(c) 2023 Foo", "2023 Foo Copyright", "Foo (c) 2023"]:
+            self.assertEqual(copyright_text, _clean_copyright_text(copyright_text))
+
+
+if __name__ == "__main__":
+    unittest.main()
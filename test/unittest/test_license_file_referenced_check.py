@@ -0,0 +1,55 @@
+# Copyright (c) 2026 - for information on the respective copyright owner
+# see the NOTICE file and/or the repository
+# https://github.com/boschresearch/ros_license_toolkit
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the license_file_referenced_check module"""
+
+import os
+import unittest
+from unittest import mock
+
+from ros_license_toolkit.license_checks.license_file_referenced_check import (
+    _is_in_path,
+    is_in_package,
+)
+
+
+class TestLicenseFileReferencedCheck(unittest.TestCase):
+    """Test the license_file_referenced_check module"""
+
+    def test_is_in_path(self):
+        """Test if files are found to be in or above the package path"""
+        for pkg_path in [".", "pkg", "pkg/", os.path.abspath("pkg")]:
+            parent = os.path.abspath(pkg_path)
+            self.assertTrue(_is_in_path(parent, "LICENSE"), pkg_path)
+            self.assertTrue(_is_in_path(parent, "sub/LICENSE"), pkg_path)
+            self.assertTrue(_is_in_path(parent, "./sub/../LICENSE"), pkg_path)
+            self.assertTrue(_is_in_path(parent, "."), pkg_path)
+            self.assertFalse(_is_in_path(parent, "../LICENSE"), pkg_path)
+            self.assertFalse(_is_in_path(parent, "../pkg_b/LICENSE"), pkg_path)
+        self.assertFalse(_is_in_path("/a/pkg", "../pkg_b/LICENSE"))
+        self.assertTrue(_is_in_path("/", "LICENSE"))
+
+    def test_is_in_package(self):
+        """Test that relative package paths are made absolute"""
+        for pkg_path in [".", "./", "pkg", "../pkg"]:
+            package = mock.Mock(abspath=pkg_path)
+            self.assertTrue(is_in_package(package, "LICENSE"), pkg_path)
+            self.assertTrue(is_in_package(package, "sub/LICENSE"), pkg_path)
+            self.assertFalse(is_in_package(package, "../LICENSE"), pkg_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
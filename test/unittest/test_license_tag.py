@@ -16,10 +16,21 @@
 
 """Unit tests for the license tag module"""
 
+import os
+import tempfile
 import unittest
+from glob import glob
 from xml.etree import ElementTree as ET
 
-from ros_license_toolkit.license_tag import LicenseTag, is_license_name_in_spdx_list
+from lxml import etree
+
+from ros_license_toolkit.license_tag import (
+    LicenseTag,
+    _eval_glob,
+    _get_relpath,
+    get_non_hidden_files,
+    is_license_name_in_spdx_list,
+)
 
 
 class TestChecks(unittest.TestCase):
@@ -35,6 +46,62 @@ class TestChecks(unittest.TestCase):
         by_spdx_tag = LicenseTag(ET.fromstring("<license>Apache-2.0</license>"), "")
         self.assertEqual(by_spdx_tag.id, "Apache-2.0")
 
+    def test_init_lxml(self):
+        """Test the constructor of the LicenseTag class with an lxml element,
+        as it gets from a parsed package.xml"""
+        by_spdx_tag = LicenseTag(etree.fromstring("<license>Apache-2.0</license>"), "")
+        self.assertEqual(by_spdx_tag.id, "Apache-2.0")
+
+    def test_get_non_hidden_files(self):
+        """Test that get_non_hidden_files finds the same files as the
+        glob `**` that it replaces, with hidden files and symlinks"""
+        with tempfile.TemporaryDirectory() as pkg_path:
+            for fname in ["a.py", "sub/b.py", "sub/.c.py", ".d", ".hidden/e.py"]:
+                fpath = os.path.join(pkg_path, fname)
+                os.makedirs(os.path.dirname(fpath), exist_ok=True)
+                with open(fpath, "w", encoding="utf-8") as f:
+                    f.write("foo")
+            os.symlink("sub", os.path.join(pkg_path, "linked_dir"))
+            os.symlink("a.py", os.path.join(pkg_path, "linked_file.py"))
+            os.symlink("does_not_exist", os.path.join(pkg_path, "dangling.py"))
+            expected = {
+                os.path.relpath(fpath, pkg_path)
+                for fpath in glob(os.path.join(pkg_path, "**"), recursive=True)
+                if os.path.isfile(fpath)
+            }
+            self.assertEqual({"a.py", "sub/b.py", "linked_dir/b.py", "linked_file.py"}, expected)
+            self.assertEqual(expected, get_non_hidden_files(pkg_path))
+
+    def test_get_relpath(self):
+        """Test that _get_relpath gives the same as os.path.relpath, also
+        for paths that are not inside of the package"""
+        for pkg_path in ["pkg", "pkg/", "./pkg", "/a/pkg", "."]:
+            for fname in ["a.py", "sub/b.py", "sub//b.py", "sub/./b.py", "../c.py", "/d.py"]:
+                fpath = os.path.join(pkg_path, fname)
+                self.assertEqual(
+                    os.path.relpath(fpath, pkg_path), _get_relpath(fpath, pkg_path), fpath
+                )
+
+    def test_eval_glob(self):
+        """Test that plain paths are evaluated like globs"""
+        with tempfile.TemporaryDirectory() as pkg_path:
+            for fname in ["a.py", "sub/b.py", "sub/c.cpp"]:
+                fpath = os.path.join(pkg_path, fname)
+                os.makedirs(os.path.dirname(fpath), exist_ok=True)
+                with open(fpath, "w", encoding="utf-8") as f:
+                    f.write("foo")
+            for glob_str in ["a.py", "sub/b.py", "./sub/b.py", "sub", "missing.py"]:
+                expected = {
+                    os.path.relpath(fpath, pkg_path)
+                    for fpath in glob(os.path.join(pkg_path, glob_str), recursive=True)
+                    if os.path.isfile(fpath)
+                }
+                self.assertEqual(expected, _eval_glob(glob_str, pkg_path), glob_str)
+            self.assertEqual({"a.py"}, _eval_glob("a.py", pkg_path))
+            self.assertEqual(set(), _eval_glob("sub", pkg_path))
+            self.assertEqual({"sub/b.py", "sub/c.cpp"}, _eval_glob("sub/*", pkg_path))
+            self.assertEqual({"a.py", "sub/b.py"}, _eval_glob("**/*.py", pkg_path))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,85 @@
+# Copyright (c) 2026 - for information on the respective copyright owner
+# see the NOTICE file and/or the repository
+# https://github.com/boschresearch/ros_license_toolkit
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the package module"""
+
+import fnmatch
+import os
+import tempfile
+import unittest
+
+import git
+
+from ros_license_toolkit.package import _compile_patterns, get_packages_in_path
+from ros_license_toolkit.repo import REPO_SEARCH_DEPTH
+
+
+class TestPackage(unittest.TestCase):
+    """Test the package module"""
+
+    def test_compile_patterns(self):
+        """Test that the combined patterns match the same paths as
+        fnmatch.filter with each pattern"""
+        paths = [
+            ".git/config",
+            ".git/refs/heads/main",
+            "sub/.git/config",
+            ".gitignore",
+            "a.pyc",
+            "sub/b.pyc",
+            "sub/b.py",
+            "README.md",
+            "doc/README.md",
+        ]
+        for patterns in [
+            [".git/*"],
+            ["*.pyc"],
+            ["*/b.py"],
+            ["README.md"],
+            ["README.md", ".git/*", "*.pyc"],
+        ]:
+            expected = {m for pattern in patterns for m in fnmatch.filter(paths, pattern)}
+            is_ignored = _compile_patterns(patterns)
+            self.assertEqual(expected, set(filter(is_ignored, paths)), patterns)
+        is_ignored = _compile_patterns([".git/*", "*.pyc"])
+        self.assertTrue(is_ignored(".git/refs/heads/main"))
+        self.assertFalse(is_ignored("sub/.git/config"))
+        self.assertTrue(is_ignored("sub/b.pyc"))
+        self.assertFalse(is_ignored("sub/b.py"))
+        self.assertFalse(_compile_patterns([])("a.py"))
+
+    def test_get_packages_in_path_deep_in_repo(self):
+        """Test that a package deeper in its repo than REPO_SEARCH_DEPTH
+        gets the repo of the searched path"""
+        with tempfile.TemporaryDirectory() as repo_path:
+            pkg_path = os.path.join(repo_path, *["sub"] * REPO_SEARCH_DEPTH, "pkg")
+            os.makedirs(pkg_path)
+            with open(os.path.join(pkg_path, "package.xml"), "w", encoding="utf-8") as f:
+                f.write('<package format="3"><name>pkg</name></package>')
+            repo = git.Repo.init(repo_path)
+            repo.index.add([os.path.join(pkg_path, "package.xml")])
+            repo.index.commit("initial commit")
+
+            packages = get_packages_in_path(repo_path)
+            self.assertEqual(["pkg"], [pkg.name for pkg in packages])
+            self.assertIsNotNone(packages[0].repo)
+            self.assertEqual(
+                os.path.realpath(repo_path), os.path.realpath(packages[0].repo.get_path())
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
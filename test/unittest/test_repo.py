@@ -21,7 +21,7 @@ import unittest
 
 import git
 
-from ros_license_toolkit.repo import NotARepoError, Repo
+from ros_license_toolkit.repo import NotARepoError, Repo, find_repo_path
 
 
 class TestRepo(unittest.TestCase):
@@ -49,3 +49,9 @@ class TestRepo(unittest.TestCase):
         repo = Repo(os.path.join(os.path.dirname(__file__)))
         git_repo = git.Repo(repo.get_path())
         self.assertEqual(repo.get_hash(), git_repo.head.object.hexsha)
+
+    def test_find_repo_path(self):
+        """Test the find_repo_path function"""
+        repo = Repo(os.path.join(os.path.dirname(__file__)))
+        self.assertEqual(find_repo_path(os.path.dirname(__file__)), repo.get_path())
+        self.assertIsNone(find_repo_path("/"))
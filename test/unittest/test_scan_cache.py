@@ -0,0 +1,165 @@
+# Copyright (c) 2026 - for information on the respective copyright owner
+# see the NOTICE file and/or the repository
+# https://github.com/boschresearch/ros_license_toolkit
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the scan cache module"""
+
+import functools
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from scancode_config import __version__ as scancode_version
+
+from ros_license_toolkit import __version__
+from ros_license_toolkit.scan_cache import (
+    CACHE_VERSION,
+    MAX_ENTRY_AGE,
+    NO_CACHE_ENV_VAR,
+    ScanCache,
+    get_file_hash,
+    prune_scan_caches,
+    scan_files_cached,
+)
+
+
+class TestScanCache(unittest.TestCase):
+    """Test the scan cache module"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        patcher = mock.patch("ros_license_toolkit.scan_cache.CACHE_DIR", self.tmp_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp_dir.cleanup)
+        # the cache may be disabled in the environment of the tests
+        env_patcher = mock.patch.dict(os.environ)
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        os.environ.pop(NO_CACHE_ENV_VAR, None)
+
+    def _write_files(self, contents):
+        """Write files with the given `contents` and return their paths."""
+        paths = []
+        for i, content in enumerate(contents):
+            paths.append(os.path.join(self.tmp_dir.name, f"file_{i}"))
+            with open(paths[-1], "w", encoding="utf-8") as f:
+                f.write(content)
+        return paths
+
+    def test_get_file_hash(self):
+        """Test that the hash only depends on the file content"""
+        paths = self._write_files(["foo", "foo", "bar"])
+        self.assertEqual(get_file_hash(paths[0]), get_file_hash(paths[1]))
+        self.assertNotEqual(get_file_hash(paths[0]), get_file_hash(paths[2]))
+
+    def test_persistence(self):
+        """Test that results are available in a new cache"""
+        cache = ScanCache("test")
+        self.assertIsNone(cache.get("hash"))
+        cache.set("hash", {"foo": ["bar"]})
+        self.assertEqual(ScanCache("test").get("hash"), {"foo": ["bar"]})
+        self.assertIsNone(ScanCache("other").get("hash"))
+
+    def test_concurrent_caches(self):
+        """Test that caches used at the same time, e.g. by worker processes,
+        do not lose each other's results"""
+        cache_a = ScanCache("test")
+        cache_b = ScanCache("test")
+        cache_a.set("hash_a", {"foo": "a"})
+        cache_b.set("hash_b", {"foo": "b"})
+        cache = ScanCache("test")
+        self.assertEqual(cache.get("hash_a"), {"foo": "a"})
+        self.assertEqual(cache.get("hash_b"), {"foo": "b"})
+
+    def test_results_are_copied(self):
+        """Test that changing returned results does not change the cache"""
+        cache = ScanCache("test")
+        results = {"foo": "bar"}
+        cache.set("hash", results)
+        results["filename"] = "a"
+        cache.get("hash")["filename"] = "b"  # type: ignore[index]
+        self.assertEqual(cache.get("hash"), {"foo": "bar"})
+
+    def test_invalidated_by_version(self):
+        """Test that results of other versions are not used"""
+        self.assertIn(scancode_version, CACHE_VERSION)
+        self.assertIn(__version__, CACHE_VERSION)
+        ScanCache("test").set("hash", {"foo": ["bar"]})
+        with mock.patch("ros_license_toolkit.scan_cache.CACHE_VERSION", "0.0.0"):
+            self.assertIsNone(ScanCache("test").get("hash"))
+
+    def test_invalidated_by_options(self):
+        """Test that results of scans with other options are not used"""
+        ScanCache("test", {"a": 1, "b": 2}).set("hash", {"foo": ["bar"]})
+        self.assertEqual(ScanCache("test", {"b": 2, "a": 1}).get("hash"), {"foo": ["bar"]})
+        self.assertIsNone(ScanCache("test", {"a": 2, "b": 2}).get("hash"))
+        self.assertIsNone(ScanCache("test").get("hash"))
+        self.assertEqual(ScanCache("test", {}).path, ScanCache("test").path)
+
+    def test_prune(self):
+        """Test that old entries and other scancode versions are removed"""
+        ScanCache("test").set("new", {"foo": "bar"})
+        ScanCache("test").set("old", {"foo": "bar"})
+        old_time = time.time() - MAX_ENTRY_AGE - 1
+        # pylint: disable=protected-access
+        os.utime(ScanCache("test")._get_entry_path("old"), (old_time, old_time))
+        with mock.patch("ros_license_toolkit.scan_cache.CACHE_VERSION", "0.0.0"):
+            ScanCache("test").set("other_version", {"foo": "bar"})
+        prune_scan_caches()
+        self.assertIsNotNone(ScanCache("test").get("new"))
+        self.assertIsNone(ScanCache("test").get("old"))
+        self.assertNotIn("0.0.0", os.listdir(self.tmp_dir.name))
+
+    def test_scan_files_cached(self):
+        """Test that files are only scanned if their content is new"""
+        paths = self._write_files(["foo", "foo", "bar"])
+        scan_function = mock.Mock(side_effect=lambda fpath: {"path": fpath})
+        results = scan_files_cached("test", scan_function, paths)
+        self.assertEqual(list(results), paths)
+        self.assertEqual(3, scan_function.call_count)
+        scan_files_cached("test", scan_function, paths)
+        self.assertEqual(3, scan_function.call_count)
+
+    def test_scan_files_cached_options(self):
+        """Test that scans with other options are cached separately"""
+        paths = self._write_files(["foo"])
+        scan_function = mock.Mock(side_effect=lambda fpath, **kwargs: {"kwargs": kwargs})
+        with_options = functools.partial(scan_function, a=1)
+        self.assertEqual(
+            {paths[0]: {"kwargs": {"a": 1}}}, scan_files_cached("test", with_options, paths)
+        )
+        scan_files_cached("test", functools.partial(scan_function, a=1), paths)
+        self.assertEqual(1, scan_function.call_count)
+        self.assertEqual(
+            {paths[0]: {"kwargs": {}}}, scan_files_cached("test", scan_function, paths)
+        )
+        self.assertEqual(2, scan_function.call_count)
+
+    def test_disabled(self):
+        """Test that nothing is cached if the cache is disabled"""
+        paths = self._write_files(["foo"])
+        scan_function = mock.Mock(side_effect=lambda fpath: {"path": fpath})
+        with mock.patch.dict(os.environ, {NO_CACHE_ENV_VAR: "1"}):
+            scan_files_cached("test", scan_function, paths)
+            scan_files_cached("test", scan_function, paths)
+        self.assertEqual(2, scan_function.call_count)
+        self.assertEqual(["file_0"], os.listdir(self.tmp_dir.name))
+
+
+if __name__ == "__main__":
+    unittest.main()